@@ -0,0 +1,87 @@
+import atexit
+import threading
+from collections import deque
+
+
+class ActivityLog:
+    """In-memory activity buffer flushed to the database by a background thread
+
+    Request handlers call ``record`` which only appends to a bounded buffer.
+    A background thread wakes every ``flush_interval`` seconds (or as soon as
+    ``max_batch`` events are waiting), drains the buffer and hands the events
+    to ``flush`` inside an app context, so the request path never commits.
+    When the buffer is full the oldest events are dropped. A batch whose flush
+    fails is put back at the front of the buffer and retried on the next
+    interval; after ``max_retries`` consecutive failures it is dropped and
+    logged.
+    """
+
+    def __init__(self, app, flush, flush_interval=1.0, max_batch=500, max_buffer=10000, max_retries=3):
+        self.app = app
+        self.flush = flush
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_retries = max_retries
+        self._failures = 0
+        self._buffer = deque(maxlen=max_buffer)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread = None
+
+    def record(self, **event):
+        """Buffer one event for the next flush"""
+        self._ensure_started()
+        with self._lock:
+            self._buffer.append(event)
+            if len(self._buffer) >= self.max_batch:
+                self._wake.set()
+
+    def close(self):
+        """Flush anything still buffered and stop the flusher thread"""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+            self._stopping = True
+        if thread is not None:
+            self._wake.set()
+            thread.join()
+
+    def _ensure_started(self):
+        # Started lazily so importing the app (e.g. the reloader parent) does not spawn a flusher
+        with self._lock:
+            if self._thread is None and not self._stopping:
+                self._thread = threading.Thread(target=self._run, name='activity-log', daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self):
+        with self.app.app_context():
+            while True:
+                self._wake.wait(self.flush_interval)
+                self._wake.clear()
+                self._drain()
+                if self._stopping:
+                    return
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                batch = [self._buffer.popleft() for _ in range(min(self.max_batch, len(self._buffer)))]
+            if not batch:
+                return
+            try:
+                self.flush(batch)
+            except Exception:
+                self._failures += 1
+                if self._failures > self.max_retries:
+                    self.app.logger.exception('Dropping %d activity events after %d failed flushes',
+                                              len(batch), self._failures)
+                    self._failures = 0
+                else:
+                    self.app.logger.warning('Activity log flush failed, retrying %d events next interval',
+                                            len(batch), exc_info=True)
+                    with self._lock:
+                        self._buffer.extendleft(reversed(batch))
+                return
+            self._failures = 0
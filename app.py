@@ -1,6 +1,11 @@
 from flask import Flask, request, jsonify, render_template
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
+import sqlalchemy as sa
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from activity_log import ActivityLog
+from write_queue import WriteQueue
+from datetime import date, datetime, timedelta
 import os
 
 app = Flask(__name__)
@@ -12,10 +17,19 @@ basedir = os.path.abspath(os.path.dirname(__file__))
 if os.environ.get('VERCEL'):
     app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
 else:
-    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(basedir, "referral.db")}'
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.environ.get("REFERRAL_DB", os.path.join(basedir, "referral.db"))}'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Optional single-writer mode: doctor mutations are group-committed by a background thread
+app.config['WRITE_QUEUE_ENABLED'] = os.environ.get('WRITE_QUEUE') == '1'
+# Referral activity log: buffered in memory, flushed in batches, raw events kept for this many days
+app.config['ACTIVITY_FLUSH_INTERVAL'] = float(os.environ.get('ACTIVITY_FLUSH_INTERVAL', '1.0'))
+app.config['ACTIVITY_RETENTION_DAYS'] = int(os.environ.get('ACTIVITY_RETENTION_DAYS', '90'))
+# Rollups outlive the raw events, but analytics windows are capped at ten years and 100 rows
+app.config['ANALYTICS_MAX_DAYS'] = 3650
+app.config['ANALYTICS_MAX_LIMIT'] = 100
 
 db = SQLAlchemy(app)
+write_queue = WriteQueue(app, db) if app.config['WRITE_QUEUE_ENABLED'] else None
 
 # Doctor model
 class Doctor(db.Model):
@@ -66,6 +80,166 @@ class Doctor(db.Model):
             }
         }
 
+# Predefined list of medical specialties
+SPECIALTIES = [
+    'Allergy and Immunology',
+    'Anesthesiology',
+    'Cardiology',
+    'Cardiothoracic Surgery',
+    'Dermatology',
+    'Emergency Medicine',
+    'Endocrinology',
+    'Family Medicine',
+    'Gastroenterology',
+    'General Surgery',
+    'Geriatrics',
+    'Hematology/Oncology',
+    'Infectious Disease',
+    'Internal Medicine',
+    'Nephrology',
+    'Neurology',
+    'Neurosurgery',
+    'Obstetrics and Gynecology',
+    'Ophthalmology',
+    'Orthopedic Surgery',
+    'Otolaryngology (ENT)',
+    'Pathology',
+    'Pediatrics',
+    'Physical Medicine and Rehabilitation',
+    'Plastic Surgery',
+    'Psychiatry',
+    'Pulmonology',
+    'Radiology',
+    'Rheumatology',
+    'Urology',
+    'Vascular Surgery'
+]
+
+# Insurance plans a doctor can accept (one takes_<insurance> column each)
+INSURANCES = [
+    'carefirst_community_healthplan',
+    'united_healthcare_community',
+    'priority_partners',
+    'maryland_physicians_care',
+    'aetna_betterhealth',
+    'maryland_medical_assistance',
+    'wellpoint',
+    'aetna_medicare',
+    'carefirst_medicare',
+    'cigna_medicare',
+    'humana',
+    'john_hopkins',
+    'united_healthcare_medicare'
+]
+
+# Referral activity models: raw events partitioned by day, plus daily rollups for analytics
+class ReferralActivity(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    day = db.Column(db.Date, nullable=False, index=True)
+    created_at = db.Column(db.DateTime, nullable=False)
+    kind = db.Column(db.String(20), nullable=False)  # 'search' or 'referral'
+    specialty = db.Column(db.String(50))
+    insurance = db.Column(db.String(50))
+    doctor_id = db.Column(db.Integer)
+    doctor_name = db.Column(db.String(100))
+    result_count = db.Column(db.Integer)
+
+class SearchRollup(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    day = db.Column(db.Date, nullable=False)
+    specialty = db.Column(db.String(50), nullable=False)
+    insurance = db.Column(db.String(50), nullable=False)
+    searches = db.Column(db.Integer, nullable=False, default=0)
+    zero_result_searches = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (db.UniqueConstraint('day', 'specialty', 'insurance'),)
+
+class ReferralRollup(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    day = db.Column(db.Date, nullable=False)
+    doctor_id = db.Column(db.Integer, nullable=False)
+    doctor_name = db.Column(db.String(100), nullable=False)
+    referrals = db.Column(db.Integer, nullable=False, default=0)
+
+    # Keyed by name too: a reseeded doctor can reuse an id on the same day as its previous owner
+    __table_args__ = (db.UniqueConstraint('day', 'doctor_id', 'doctor_name'),)
+
+def run_write(operation):
+    """Run a doctor mutation and commit it, through the write queue when enabled"""
+    if write_queue is not None:
+        return write_queue.submit(operation)
+    try:
+        result = operation()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return result
+
+def write_activity(events):
+    """Insert a batch of activity events, add them to the daily rollups and drop expired days"""
+    rows = []
+    searches = {}
+    referrals = {}
+    for event in events:
+        day = event['created_at'].date()
+        rows.append({
+            'day': day,
+            'created_at': event['created_at'],
+            'kind': event['kind'],
+            'specialty': event.get('specialty'),
+            'insurance': event.get('insurance'),
+            'doctor_id': event.get('doctor_id'),
+            'doctor_name': event.get('doctor_name'),
+            'result_count': event.get('result_count')
+        })
+        if event['kind'] == 'search':
+            counts = searches.setdefault((day, event['specialty'], event['insurance']), [0, 0])
+            counts[0] += 1
+            if event['result_count'] == 0:
+                counts[1] += 1
+        elif event['kind'] == 'referral':
+            key = (day, event['doctor_id'], event['doctor_name'])
+            referrals[key] = referrals.get(key, 0) + 1
+    
+    db.session.execute(sa.insert(ReferralActivity.__table__), rows)
+    
+    if searches:
+        stmt = sqlite_insert(SearchRollup.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['day', 'specialty', 'insurance'],
+            set_={
+                'searches': SearchRollup.searches + stmt.excluded.searches,
+                'zero_result_searches': SearchRollup.zero_result_searches + stmt.excluded.zero_result_searches
+            }
+        )
+        db.session.execute(stmt, [
+            {'day': day, 'specialty': specialty, 'insurance': insurance,
+             'searches': total, 'zero_result_searches': zero}
+            for (day, specialty, insurance), (total, zero) in searches.items()
+        ])
+    
+    if referrals:
+        stmt = sqlite_insert(ReferralRollup.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['day', 'doctor_id', 'doctor_name'],
+            set_={'referrals': ReferralRollup.referrals + stmt.excluded.referrals}
+        )
+        db.session.execute(stmt, [
+            {'day': day, 'doctor_id': doctor_id, 'doctor_name': doctor_name, 'referrals': total}
+            for (day, doctor_id, doctor_name), total in referrals.items()
+        ])
+    
+    # Retention works on whole days, so expiring old activity is a range delete on the day index
+    cutoff = date.today() - timedelta(days=app.config['ACTIVITY_RETENTION_DAYS'])
+    db.session.execute(sa.delete(ReferralActivity).where(ReferralActivity.day < cutoff))
+
+activity_log = ActivityLog(
+    app,
+    lambda events: run_write(lambda: write_activity(events)),
+    flush_interval=app.config['ACTIVITY_FLUSH_INTERVAL']
+)
+
 # Routes
 @app.route('/')
 def index():
@@ -74,60 +248,12 @@ def index():
 @app.route('/api/specialties')
 def get_specialties():
     """Get all available specialties"""
-    # Predefined list of medical specialties
-    specialties = [
-        'Allergy and Immunology',
-        'Anesthesiology',
-        'Cardiology',
-        'Cardiothoracic Surgery',
-        'Dermatology',
-        'Emergency Medicine',
-        'Endocrinology',
-        'Family Medicine',
-        'Gastroenterology',
-        'General Surgery',
-        'Geriatrics',
-        'Hematology/Oncology',
-        'Infectious Disease',
-        'Internal Medicine',
-        'Nephrology',
-        'Neurology',
-        'Neurosurgery',
-        'Obstetrics and Gynecology',
-        'Ophthalmology',
-        'Orthopedic Surgery',
-        'Otolaryngology (ENT)',
-        'Pathology',
-        'Pediatrics',
-        'Physical Medicine and Rehabilitation',
-        'Plastic Surgery',
-        'Psychiatry',
-        'Pulmonology',
-        'Radiology',
-        'Rheumatology',
-        'Urology',
-        'Vascular Surgery'
-    ]
-    return jsonify(sorted(specialties))
+    return jsonify(sorted(SPECIALTIES))
 
 @app.route('/api/insurances')
 def get_insurances():
     """Get all available insurance options"""
-    return jsonify([
-        'carefirst_community_healthplan',
-        'united_healthcare_community',
-        'priority_partners',
-        'maryland_physicians_care',
-        'aetna_betterhealth',
-        'maryland_medical_assistance',
-        'wellpoint',
-        'aetna_medicare',
-        'carefirst_medicare',
-        'cigna_medicare',
-        'humana',
-        'john_hopkins',
-        'united_healthcare_medicare'
-    ])
+    return jsonify(INSURANCES)
 
 @app.route('/api/doctors')
 def get_doctors():
@@ -137,6 +263,8 @@ def get_doctors():
     
     if not specialty or not insurance:
         return jsonify({'error': 'Both specialty and insurance are required'}), 400
+    if specialty not in SPECIALTIES:
+        return jsonify({'error': 'Invalid specialty'}), 400
     
     # Build query based on specialty and insurance
     query = Doctor.query.filter(Doctor.specialty == specialty)
@@ -164,8 +292,90 @@ def get_doctors():
         return jsonify({'error': 'Invalid insurance type'}), 400
     
     doctors = query.all()
+    activity_log.record(kind='search', specialty=specialty, insurance=insurance,
+                        result_count=len(doctors), created_at=datetime.now())
     return jsonify([doctor.to_dict() for doctor in doctors])
 
+@app.route('/api/doctors/<int:doctor_id>/referrals', methods=['POST'])
+def refer_doctor(doctor_id):
+    """Record that a doctor was picked for a referral"""
+    doctor = db.session.get(Doctor, doctor_id)
+    if doctor is None:
+        return jsonify({'error': 'Doctor not found'}), 404
+    
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    
+    specialty = data.get('specialty') or None
+    insurance = data.get('insurance') or None
+    if specialty is not None and specialty not in SPECIALTIES:
+        return jsonify({'error': 'Invalid specialty'}), 400
+    if insurance is not None and insurance not in INSURANCES:
+        return jsonify({'error': 'Invalid insurance type'}), 400
+    
+    activity_log.record(kind='referral', specialty=specialty or doctor.specialty, insurance=insurance,
+                        doctor_id=doctor.id, doctor_name=doctor.name, created_at=datetime.now())
+    return jsonify({'message': 'Referral recorded'}), 202
+
+@app.route('/api/analytics')
+def get_analytics():
+    """Get search and referral analytics from the daily rollups"""
+    try:
+        days = int(request.args.get('days', 30))
+        limit = int(request.args.get('limit', 10))
+    except ValueError:
+        return jsonify({'error': 'days and limit must be integers'}), 400
+    if days < 1 or limit < 1:
+        return jsonify({'error': 'days and limit must be positive'}), 400
+    if days > app.config['ANALYTICS_MAX_DAYS']:
+        return jsonify({'error': f"days must be at most {app.config['ANALYTICS_MAX_DAYS']}"}), 400
+    if limit > app.config['ANALYTICS_MAX_LIMIT']:
+        return jsonify({'error': f"limit must be at most {app.config['ANALYTICS_MAX_LIMIT']}"}), 400
+    
+    since = date.today() - timedelta(days=days - 1)
+    
+    searches = sa.func.sum(SearchRollup.searches).label('searches')
+    zero_results = sa.func.sum(SearchRollup.zero_result_searches).label('zero_result_searches')
+    combinations = (
+        sa.select(SearchRollup.specialty, SearchRollup.insurance, searches, zero_results)
+        .where(SearchRollup.day >= since)
+        .group_by(SearchRollup.specialty, SearchRollup.insurance)
+    )
+    top_combinations = db.session.execute(
+        combinations.order_by(searches.desc()).limit(limit)
+    ).all()
+    zero_result_combinations = db.session.execute(
+        combinations.having(zero_results > 0).order_by(zero_results.desc()).limit(limit)
+    ).all()
+    
+    referrals = sa.func.sum(ReferralRollup.referrals).label('referrals')
+    doctor_referrals = db.session.execute(
+        sa.select(ReferralRollup.doctor_id, ReferralRollup.doctor_name, referrals)
+        .where(ReferralRollup.day >= since)
+        .group_by(ReferralRollup.doctor_id, ReferralRollup.doctor_name)
+        .order_by(referrals.desc())
+        .limit(limit)
+    ).all()
+    
+    return jsonify({
+        'since': since.isoformat(),
+        'top_combinations': [
+            {'specialty': row.specialty, 'insurance': row.insurance,
+             'searches': row.searches, 'zero_result_searches': row.zero_result_searches}
+            for row in top_combinations
+        ],
+        'zero_result_combinations': [
+            {'specialty': row.specialty, 'insurance': row.insurance,
+             'searches': row.searches, 'zero_result_searches': row.zero_result_searches}
+            for row in zero_result_combinations
+        ],
+        'doctor_referrals': [
+            {'doctor_id': row.doctor_id, 'name': row.doctor_name, 'referrals': row.referrals}
+            for row in doctor_referrals
+        ]
+    })
+
 @app.route('/api/doctors/all')
 def get_all_doctors():
     """Get all doctors for admin purposes"""
@@ -184,32 +394,36 @@ def add_doctor():
             if not data.get(field):
                 return jsonify({'error': f'{field} is required'}), 400
         
-        # Create new doctor
-        doctor = Doctor(
-            name=data['name'],
-            specialty=data['specialty'],
-            address=data['address'],
-            phone=data['phone'],
-            fax=data['fax'],
-            takes_carefirst_community_healthplan=data.get('takes_carefirst_community_healthplan', False),
-            takes_united_healthcare_community=data.get('takes_united_healthcare_community', False),
-            takes_priority_partners=data.get('takes_priority_partners', False),
-            takes_maryland_physicians_care=data.get('takes_maryland_physicians_care', False),
-            takes_aetna_betterhealth=data.get('takes_aetna_betterhealth', False),
-            takes_maryland_medical_assistance=data.get('takes_maryland_medical_assistance', False),
-            takes_wellpoint=data.get('takes_wellpoint', False),
-            takes_aetna_medicare=data.get('takes_aetna_medicare', False),
-            takes_carefirst_medicare=data.get('takes_carefirst_medicare', False),
-            takes_cigna_medicare=data.get('takes_cigna_medicare', False),
-            takes_humana=data.get('takes_humana', False),
-            takes_john_hopkins=data.get('takes_john_hopkins', False),
-            takes_united_healthcare_medicare=data.get('takes_united_healthcare_medicare', False)
-        )
+        def create():
+            # Create new doctor
+            doctor = Doctor(
+                name=data['name'],
+                specialty=data['specialty'],
+                address=data['address'],
+                phone=data['phone'],
+                fax=data['fax'],
+                takes_carefirst_community_healthplan=data.get('takes_carefirst_community_healthplan', False),
+                takes_united_healthcare_community=data.get('takes_united_healthcare_community', False),
+                takes_priority_partners=data.get('takes_priority_partners', False),
+                takes_maryland_physicians_care=data.get('takes_maryland_physicians_care', False),
+                takes_aetna_betterhealth=data.get('takes_aetna_betterhealth', False),
+                takes_maryland_medical_assistance=data.get('takes_maryland_medical_assistance', False),
+                takes_wellpoint=data.get('takes_wellpoint', False),
+                takes_aetna_medicare=data.get('takes_aetna_medicare', False),
+                takes_carefirst_medicare=data.get('takes_carefirst_medicare', False),
+                takes_cigna_medicare=data.get('takes_cigna_medicare', False),
+                takes_humana=data.get('takes_humana', False),
+                takes_john_hopkins=data.get('takes_john_hopkins', False),
+                takes_united_healthcare_medicare=data.get('takes_united_healthcare_medicare', False)
+            )
         
-        db.session.add(doctor)
-        db.session.commit()
+            db.session.add(doctor)
+            db.session.flush()
+            return doctor.to_dict()
+            
+        doctor = run_write(create)
         
-        return jsonify({'message': 'Doctor added successfully', 'doctor': doctor.to_dict()}), 201
+        return jsonify({'message': 'Doctor added successfully', 'doctor': doctor}), 201
         
     except Exception as e:
         db.session.rollback()
@@ -219,52 +433,57 @@ def add_doctor():
 def update_doctor(doctor_id):
     """Update an existing doctor"""
     try:
-        doctor = Doctor.query.get_or_404(doctor_id)
         data = request.get_json()
         
-        # Update fields if provided
-        if 'name' in data:
-            doctor.name = data['name']
-        if 'specialty' in data:
-            doctor.specialty = data['specialty']
-        if 'address' in data:
-            doctor.address = data['address']
-        if 'phone' in data:
-            doctor.phone = data['phone']
-        if 'fax' in data:
-            doctor.fax = data['fax']
+        def update():
+            doctor = Doctor.query.get_or_404(doctor_id)
         
-        # Update insurance fields
-        if 'takes_carefirst_community_healthplan' in data:
-            doctor.takes_carefirst_community_healthplan = data['takes_carefirst_community_healthplan']
-        if 'takes_united_healthcare_community' in data:
-            doctor.takes_united_healthcare_community = data['takes_united_healthcare_community']
-        if 'takes_priority_partners' in data:
-            doctor.takes_priority_partners = data['takes_priority_partners']
-        if 'takes_maryland_physicians_care' in data:
-            doctor.takes_maryland_physicians_care = data['takes_maryland_physicians_care']
-        if 'takes_aetna_betterhealth' in data:
-            doctor.takes_aetna_betterhealth = data['takes_aetna_betterhealth']
-        if 'takes_maryland_medical_assistance' in data:
-            doctor.takes_maryland_medical_assistance = data['takes_maryland_medical_assistance']
-        if 'takes_wellpoint' in data:
-            doctor.takes_wellpoint = data['takes_wellpoint']
-        if 'takes_aetna_medicare' in data:
-            doctor.takes_aetna_medicare = data['takes_aetna_medicare']
-        if 'takes_carefirst_medicare' in data:
-            doctor.takes_carefirst_medicare = data['takes_carefirst_medicare']
-        if 'takes_cigna_medicare' in data:
-            doctor.takes_cigna_medicare = data['takes_cigna_medicare']
-        if 'takes_humana' in data:
-            doctor.takes_humana = data['takes_humana']
-        if 'takes_john_hopkins' in data:
-            doctor.takes_john_hopkins = data['takes_john_hopkins']
-        if 'takes_united_healthcare_medicare' in data:
-            doctor.takes_united_healthcare_medicare = data['takes_united_healthcare_medicare']
+            # Update fields if provided
+            if 'name' in data:
+                doctor.name = data['name']
+            if 'specialty' in data:
+                doctor.specialty = data['specialty']
+            if 'address' in data:
+                doctor.address = data['address']
+            if 'phone' in data:
+                doctor.phone = data['phone']
+            if 'fax' in data:
+                doctor.fax = data['fax']
         
-        db.session.commit()
+            # Update insurance fields
+            if 'takes_carefirst_community_healthplan' in data:
+                doctor.takes_carefirst_community_healthplan = data['takes_carefirst_community_healthplan']
+            if 'takes_united_healthcare_community' in data:
+                doctor.takes_united_healthcare_community = data['takes_united_healthcare_community']
+            if 'takes_priority_partners' in data:
+                doctor.takes_priority_partners = data['takes_priority_partners']
+            if 'takes_maryland_physicians_care' in data:
+                doctor.takes_maryland_physicians_care = data['takes_maryland_physicians_care']
+            if 'takes_aetna_betterhealth' in data:
+                doctor.takes_aetna_betterhealth = data['takes_aetna_betterhealth']
+            if 'takes_maryland_medical_assistance' in data:
+                doctor.takes_maryland_medical_assistance = data['takes_maryland_medical_assistance']
+            if 'takes_wellpoint' in data:
+                doctor.takes_wellpoint = data['takes_wellpoint']
+            if 'takes_aetna_medicare' in data:
+                doctor.takes_aetna_medicare = data['takes_aetna_medicare']
+            if 'takes_carefirst_medicare' in data:
+                doctor.takes_carefirst_medicare = data['takes_carefirst_medicare']
+            if 'takes_cigna_medicare' in data:
+                doctor.takes_cigna_medicare = data['takes_cigna_medicare']
+            if 'takes_humana' in data:
+                doctor.takes_humana = data['takes_humana']
+            if 'takes_john_hopkins' in data:
+                doctor.takes_john_hopkins = data['takes_john_hopkins']
+            if 'takes_united_healthcare_medicare' in data:
+                doctor.takes_united_healthcare_medicare = data['takes_united_healthcare_medicare']
+            
+            db.session.flush()
+            return doctor.to_dict()
+            
+        doctor = run_write(update)
         
-        return jsonify({'message': 'Doctor updated successfully', 'doctor': doctor.to_dict()})
+        return jsonify({'message': 'Doctor updated successfully', 'doctor': doctor})
         
     except Exception as e:
         db.session.rollback()
@@ -274,9 +493,11 @@ def update_doctor(doctor_id):
 def delete_doctor(doctor_id):
     """Delete a doctor"""
     try:
-        doctor = Doctor.query.get_or_404(doctor_id)
-        db.session.delete(doctor)
-        db.session.commit()
+        def delete():
+            doctor = Doctor.query.get_or_404(doctor_id)
+            db.session.delete(doctor)
+
+        run_write(delete)
         
         return jsonify({'message': 'Doctor deleted successfully'})
         
@@ -288,8 +509,9 @@ def init_db():
     """Initialize database with sample data"""
     with app.app_context():
         try:
-            # Drop all tables and recreate them to handle schema changes
-            db.drop_all()
+            # Drop and recreate the doctor table to handle schema changes;
+            # activity log and rollup tables are kept so analytics history survives restarts
+            Doctor.__table__.drop(db.engine, checkfirst=True)
             db.create_all()
             
             # Check if data already exists
@@ -298,54 +520,54 @@ def init_db():
             
             # Sample doctors data with Maryland-specific insurance plans
             sample_doctors = [
-            {
-                'name': 'Dr. John Smith',
-                'specialty': 'Cardiology',
-                'address': '123 Heart Lane, Waldorf, MD 20602',
-                'phone': '301-555-0101',
-                'fax': '301-555-0102',
-                'takes_carefirst_community_healthplan': True,
-                'takes_aetna_medicare': True,
-                'takes_maryland_medical_assistance': True
-            },
-            {
-                'name': 'Dr. Sarah Johnson',
-                'specialty': 'Gastroenterology',
-                'address': '456 Stomach St, Silver Spring, MD 20910',
-                'phone': '301-555-0201',
-                'fax': '301-555-0202',
-                'takes_priority_partners': True,
-                'takes_united_healthcare_medicare': True,
-                'takes_maryland_physicians_care': True
-            },
-            {
-                'name': 'Dr. Michael Brown',
-                'specialty': 'Cardiology',
-                'address': '789 Cardiac Ave, Bethesda, MD 20814',
-                'phone': '301-555-0301',
-                'fax': '301-555-0302',
-                'takes_humana': True,
-                'takes_carefirst_medicare': True,
-                'takes_aetna_betterhealth': True
-            },
-            {
-                'name': 'Dr. Emily Davis',
-                'specialty': 'Dermatology',
-                'address': '321 Skin Way, Rockville, MD 20850',
-                'phone': '301-555-0401',
-                'fax': '301-555-0402',
-                'takes_united_healthcare_community': True,
-                'takes_wellpoint': True,
-                'takes_john_hopkins': True
-            }
-        ]
-        
-        for doctor_data in sample_doctors:
-            doctor = Doctor(**doctor_data)
-            db.session.add(doctor)
-        
-        db.session.commit()
-        print("Database initialized with sample data")
+                {
+                    'name': 'Dr. John Smith',
+                    'specialty': 'Cardiology',
+                    'address': '123 Heart Lane, Waldorf, MD 20602',
+                    'phone': '301-555-0101',
+                    'fax': '301-555-0102',
+                    'takes_carefirst_community_healthplan': True,
+                    'takes_aetna_medicare': True,
+                    'takes_maryland_medical_assistance': True
+                },
+                {
+                    'name': 'Dr. Sarah Johnson',
+                    'specialty': 'Gastroenterology',
+                    'address': '456 Stomach St, Silver Spring, MD 20910',
+                    'phone': '301-555-0201',
+                    'fax': '301-555-0202',
+                    'takes_priority_partners': True,
+                    'takes_united_healthcare_medicare': True,
+                    'takes_maryland_physicians_care': True
+                },
+                {
+                    'name': 'Dr. Michael Brown',
+                    'specialty': 'Cardiology',
+                    'address': '789 Cardiac Ave, Bethesda, MD 20814',
+                    'phone': '301-555-0301',
+                    'fax': '301-555-0302',
+                    'takes_humana': True,
+                    'takes_carefirst_medicare': True,
+                    'takes_aetna_betterhealth': True
+                },
+                {
+                    'name': 'Dr. Emily Davis',
+                    'specialty': 'Dermatology',
+                    'address': '321 Skin Way, Rockville, MD 20850',
+                    'phone': '301-555-0401',
+                    'fax': '301-555-0402',
+                    'takes_united_healthcare_community': True,
+                    'takes_wellpoint': True,
+                    'takes_john_hopkins': True
+                }
+            ]
+            
+            for doctor_data in sample_doctors:
+                doctor = Doctor(**doctor_data)
+                db.session.add(doctor)
+            
+            db.session.commit()
+            print("Database initialized with sample data")
         except Exception as e:
             print(f"Error initializing database: {e}")
             # Continue without sample data if there's an error
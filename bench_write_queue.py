@@ -0,0 +1,86 @@
+"""Benchmark per-request commits against the group-committing write queue
+
+Runs concurrent inserts against a throwaway file-based SQLite database, first
+with one commit per insert (the default write path) and then through
+WriteQueue, and prints throughput and failed writes for each.
+
+Usage: python bench_write_queue.py [threads] [writes_per_thread]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from write_queue import WriteQueue
+
+
+def make_app(path):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db = SQLAlchemy(app)
+
+    class Doctor(db.Model):
+        id = db.Column(db.Integer, primary_key=True)
+        name = db.Column(db.String(100), nullable=False)
+        specialty = db.Column(db.String(50), nullable=False)
+
+    with app.app_context():
+        db.create_all()
+    return app, db, Doctor
+
+
+def run(mode, threads, writes):
+    with tempfile.TemporaryDirectory() as tmp:
+        app, db, Doctor = make_app(os.path.join(tmp, 'bench.db'))
+        write_queue = WriteQueue(app, db) if mode == 'write-queue' else None
+        failures = []
+
+        def insert(i):
+            doctor = Doctor(name=f'Dr. {i}', specialty='Cardiology')
+            db.session.add(doctor)
+            db.session.flush()
+            return doctor.id
+
+        def worker(n):
+            with app.app_context():
+                for i in range(writes):
+                    try:
+                        if write_queue is not None:
+                            write_queue.submit(lambda: insert(i))
+                        else:
+                            insert(i)
+                            db.session.commit()
+                    except Exception as e:
+                        db.session.rollback()
+                        failures.append(e)
+
+        workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        start = time.perf_counter()
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        if write_queue is not None:
+            write_queue.close()
+        with app.app_context():
+            rows = Doctor.query.count()
+            db.session.remove()
+            db.engine.dispose()
+
+    total = threads * writes
+    print(f'{mode:>18}: {total} writes in {elapsed:.2f}s '
+          f'({total / elapsed:.0f} writes/s), {rows} rows, {len(failures)} failed')
+
+
+if __name__ == '__main__':
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    writes = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    for mode in ('per-request commit', 'write-queue'):
+        run(mode, threads, writes)
@@ -0,0 +1,9 @@
+import os
+import sys
+import tempfile
+
+# The app modules live at the repository root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# app.py recreates its database on import; point it at a throwaway file
+os.environ['REFERRAL_DB'] = os.path.join(tempfile.mkdtemp(), 'referral.db')
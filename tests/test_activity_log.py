@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from activity_log import ActivityLog
+from app import app, db, ReferralActivity, ReferralRollup, SearchRollup, write_activity
+
+
+@pytest.fixture(autouse=True)
+def clean_tables():
+    with app.app_context():
+        for model in (ReferralActivity, SearchRollup, ReferralRollup):
+            db.session.query(model).delete()
+        db.session.commit()
+    yield
+
+
+def flush(events):
+    with app.app_context():
+        write_activity(events)
+        db.session.commit()
+
+
+def search(specialty, insurance, result_count, created_at=None):
+    return {'kind': 'search', 'specialty': specialty, 'insurance': insurance,
+            'result_count': result_count, 'created_at': created_at or datetime.now()}
+
+
+def referral(doctor_id, doctor_name):
+    return {'kind': 'referral', 'specialty': 'Cardiology', 'insurance': 'humana',
+            'doctor_id': doctor_id, 'doctor_name': doctor_name, 'created_at': datetime.now()}
+
+
+def test_search_rollups_add_up_across_batches():
+    flush([search('Cardiology', 'humana', 2), search('Cardiology', 'humana', 0), search('Neurology', 'humana', 0)])
+    flush([search('Cardiology', 'humana', 0)])
+
+    with app.app_context():
+        rollups = {(r.specialty, r.insurance): (r.searches, r.zero_result_searches) for r in SearchRollup.query.all()}
+        assert ReferralActivity.query.count() == 4
+    assert rollups == {('Cardiology', 'humana'): (3, 2), ('Neurology', 'humana'): (1, 1)}
+
+
+def test_referral_rollups_keep_reused_doctor_ids_apart():
+    flush([referral(1, 'Dr. John Smith'), referral(1, 'Dr. John Smith')])
+    flush([referral(1, 'Dr. John Smith'), referral(1, 'Dr. Someone Else')])
+
+    with app.app_context():
+        rollups = {(r.doctor_id, r.doctor_name): r.referrals for r in ReferralRollup.query.all()}
+    assert rollups == {(1, 'Dr. John Smith'): 3, (1, 'Dr. Someone Else'): 1}
+
+
+def test_retention_drops_expired_days_but_keeps_rollups():
+    expired = datetime.now() - timedelta(days=app.config['ACTIVITY_RETENTION_DAYS'] + 1)
+    kept = datetime.now() - timedelta(days=app.config['ACTIVITY_RETENTION_DAYS'] - 1)
+    flush([search('Cardiology', 'humana', 1, expired), search('Cardiology', 'humana', 1, kept)])
+
+    with app.app_context():
+        assert [r.day for r in ReferralActivity.query.all()] == [kept.date()]
+        assert SearchRollup.query.count() == 2
+
+
+def test_failed_flush_is_retried_then_dropped():
+    attempts = []
+
+    def failing_flush(batch):
+        attempts.append(list(batch))
+        raise RuntimeError('database is locked')
+
+    log = ActivityLog(app, failing_flush, max_retries=2)
+    log._buffer.extend([{'n': 1}, {'n': 2}])
+
+    log._drain()
+    assert list(log._buffer) == [{'n': 1}, {'n': 2}]
+
+    log._drain()
+    log._drain()
+    assert len(attempts) == 3
+    assert list(log._buffer) == []
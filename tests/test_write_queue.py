@@ -0,0 +1,96 @@
+import threading
+from concurrent.futures import Future
+
+import pytest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+
+from write_queue import WriteQueue
+
+
+@pytest.fixture
+def env(tmp_path):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{tmp_path / "test.db"}'
+    db = SQLAlchemy(app)
+
+    class Doctor(db.Model):
+        id = db.Column(db.Integer, primary_key=True)
+        name = db.Column(db.String(100), nullable=False)
+
+    write_queue = WriteQueue(app, db, max_latency=0.2)
+    with app.app_context():
+        db.create_all()
+    yield app, db, Doctor, write_queue
+    write_queue.close()
+    with app.app_context():
+        db.engine.dispose()
+
+
+def add(db, Doctor, name):
+    def operation():
+        doctor = Doctor(name=name)
+        db.session.add(doctor)
+        db.session.flush()
+        return doctor.id
+    return operation
+
+
+def test_failing_operation_does_not_fail_its_batch(env):
+    app, db, Doctor, write_queue = env
+
+    def half_written():
+        db.session.add(Doctor(name='half'))
+        db.session.flush()
+        raise ValueError('boom')
+
+    batch = [(add(db, Doctor, 'first'), Future()), (half_written, Future()), (add(db, Doctor, 'second'), Future())]
+    with app.app_context():
+        write_queue._commit_batch(batch)
+        names = sorted(doctor.name for doctor in Doctor.query.all())
+
+    assert batch[0][1].result() and batch[2][1].result()
+    with pytest.raises(ValueError):
+        batch[1][1].result()
+    assert names == ['first', 'second']
+
+
+def test_concurrent_writes_share_one_commit(env):
+    app, db, Doctor, write_queue = env
+    commits = []
+    with app.app_context():
+        event.listen(db.engine, 'commit', lambda conn: commits.append(conn))
+
+    results = {}
+
+    def submit(i):
+        try:
+            results[i] = write_queue.submit(add(db, Doctor, f'Dr. {i}'))
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=submit, args=(i,)) for i in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(set(results.values())) == 10
+    assert all(isinstance(result, int) for result in results.values())
+    assert len(commits) < 10
+
+
+def test_writer_survives_unexpected_error(env):
+    app, db, Doctor, write_queue = env
+    commit_batch = write_queue._commit_batch
+
+    def broken(batch):
+        raise RuntimeError('rollback failed')
+
+    write_queue._commit_batch = broken
+    with pytest.raises(RuntimeError):
+        write_queue.submit(lambda: 1)
+
+    write_queue._commit_batch = commit_batch
+    assert write_queue.submit(lambda: 42) == 42
@@ -0,0 +1,155 @@
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from sqlalchemy import event
+
+
+class WriteQueue:
+    """Single-writer queue that group-commits database mutations
+
+    Callers submit an operation (a function that mutates ``db.session`` and
+    returns a result). A dedicated writer thread collects operations for up to
+    ``max_latency`` seconds or ``max_batch`` operations, runs each one in its
+    own SAVEPOINT inside a single transaction and commits once. A failing
+    operation only rolls back its own savepoint. Each caller blocks until its
+    own operation is committed and gets back the operation's return value or
+    its exception, or ``concurrent.futures.TimeoutError`` after ``timeout``
+    seconds.
+    """
+
+    _STOP = object()
+
+    def __init__(self, app, db, max_batch=64, max_latency=0.005, timeout=30):
+        self.app = app
+        self.db = db
+        self.max_batch = max_batch
+        self.max_latency = max_latency
+        self.timeout = timeout
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._atexit_registered = False
+        with app.app_context():
+            self._enable_savepoints(db.engine)
+
+    @staticmethod
+    def _enable_savepoints(engine):
+        # pysqlite opens and commits transactions on its own, which breaks SAVEPOINT;
+        # hand transaction control to SQLAlchemy so BEGIN is always emitted explicitly.
+        # Every connection then holds its read lock until the request ends, so switch to
+        # WAL, where readers never block the writer's group commit
+        if engine.dialect.name != 'sqlite':
+            return
+
+        @event.listens_for(engine, 'connect')
+        def do_connect(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+            dbapi_connection.execute('PRAGMA journal_mode=WAL')
+
+        @event.listens_for(engine, 'begin')
+        def do_begin(conn):
+            conn.exec_driver_sql('BEGIN')
+
+    def submit(self, operation):
+        """Queue an operation and wait for its committed result"""
+        future = Future()
+        # Queue under the lock so close() cannot slip a stop marker in ahead of this operation
+        with self._lock:
+            self._ensure_started()
+            self._queue.put((operation, future))
+        return future.result(timeout=self.timeout)
+
+    def close(self):
+        """Drain pending operations and stop the writer thread"""
+        with self._lock:
+            if self._thread is None:
+                return
+            # A dead writer would leave the stop marker behind for its replacement to pick up
+            if self._thread.is_alive():
+                self._queue.put(self._STOP)
+                self._thread.join()
+            self._thread = None
+
+    def _ensure_started(self):
+        # Started lazily so importing the app (e.g. the reloader parent) does not spawn a writer.
+        # Callers must hold self._lock
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='write-queue', daemon=True)
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+
+    def _run(self):
+        with self.app.app_context():
+            while True:
+                batch, stop = self._collect()
+                if batch:
+                    try:
+                        self._commit_batch(batch)
+                    except Exception as e:
+                        # Never let the writer die: fail this batch and start the next one on a fresh session
+                        self._fail(batch, e)
+                        self._reset_session()
+                if stop:
+                    self.db.session.remove()
+                    return
+
+    def _collect(self):
+        """Block for the first operation, then gather more until the batch is full or the window closes"""
+        item = self._queue.get()
+        if item is self._STOP:
+            return [], True
+
+        batch = [item]
+        deadline = time.monotonic() + self.max_latency
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is self._STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _commit_batch(self, batch):
+        session = self.db.session
+        outcomes = []
+        for operation, future in batch:
+            try:
+                with session.begin_nested():
+                    result = operation()
+            except Exception as e:
+                outcomes.append((future, None, e))
+            else:
+                outcomes.append((future, result, None))
+
+        try:
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _fail(self, batch, error):
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def _reset_session(self):
+        try:
+            self.db.session.remove()
+        except Exception as e:
+            print(f"Error resetting write queue session: {e}")